@@ -8,13 +8,19 @@ This MCP server provides tools that Claude automatically invokes when:
 - User wants to start execution mode
 - User indicates they want to move forward with implementation
 - Context suggests execution should begin
+
+Session storage is pluggable: set JARVIS_STORE=file to work directly on the
+sessions JSON file, or JARVIS_STORE=api (default) to go through the Holler
+SQLite API.
 """
 
 import asyncio
-import json
-import requests
+import fcntl
+import os
 import re
 from typing import Dict, Any, Optional
+
+import orjson
 from mcp.server.fastmcp import FastMCP
 
 # Initialize MCP server
@@ -24,36 +30,413 @@ mcp = FastMCP("jarvis-executor")
 HOLLER_API_BASE = "http://localhost:3002/api"
 MAGIC_PHRASE = "go to pound town claude code"
 
+# Session storage backend: "api" talks to the Holler SQLite API (default),
+# "file" reads/writes the sessions JSON directly
+JARVIS_STORE = os.environ.get("JARVIS_STORE", "api")
+SESSIONS_FILE = os.environ.get(
+    "HOLLER_SESSIONS_FILE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "holler-sessions.json")
+)
+
+# Compiled once at import -- detect_magic_phrase runs on every user turn
+_WS_RE = re.compile(r'\s+')
+
+def _normalize_text(text: str) -> str:
+    """Lowercase and collapse whitespace runs to single spaces.
+
+    Fast path: most user messages are ASCII with no whitespace beyond
+    single spaces, so the regex substitution (and its string allocation)
+    is skipped for them. For ASCII input \\s is exactly
+    [ \\t\\n\\r\\f\\v\\x1c-\\x1f]; anything non-ASCII falls back to the regex
+    since \\s+ also collapses Unicode whitespace like \\xa0.
+    """
+    low = text.lower().strip()
+    if (not low.isascii() or "  " in low
+            or any(c in low for c in "\t\n\r\f\v\x1c\x1d\x1e\x1f")):
+        return _WS_RE.sub(' ', low)
+    return low
+
+# Execution prompt built once at import; execute_plan only fills in the
+# plan and session id instead of reassembling the whole literal per call
+_EXECUTION_PROMPT_TPL = """🚀 **EXECUTION MODE: One-Shot Plan Implementation**
+
+**ULTRA-THINK APPROACH**: You have ONE chance to execute this plan perfectly. Think deeply about each step before acting.
+
+## Your Mission
+Execute the following plan completely and thoroughly:
+
+```
+{plan}
+```
+
+## Critical Instructions
+- **ONE SHOT EXECUTION**: This is your only opportunity - make it count
+- **ULTRA-THINK**: Before each action, consider:
+  - What exactly needs to be done?
+  - What are the potential edge cases?
+  - How can I verify this step worked?
+  - What could go wrong and how do I prevent it?
+- **BE THOROUGH**: Don't rush - think through each step carefully
+- **VERIFY YOUR WORK**: Test and validate each change you make
+- **COMPLETE THE MISSION**: Execute the entire plan, not just part of it
+
+## Execution Context
+- Session ID: {session_id}
+- Mode: EXECUTION (one-shot)
+- Plan Source: Jarvis Planning Session
+
+---
+
+**BEGIN EXECUTION NOW - ULTRA-THINK AND IMPLEMENT THE PLAN**
+"""
+
+def _read_file_bytes(path: str) -> bytes:
+    """Read a whole file in a single syscall (run in a thread)."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+class SessionStore:
+    """Storage backend interface for Holler sessions."""
+
+    async def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Return the session for session_id, or None if unknown."""
+        raise NotImplementedError
+
+    async def get_active_session(self) -> Optional[Dict[str, Any]]:
+        """Return the active Jarvis session, or any Jarvis session as fallback."""
+        raise NotImplementedError
+
+    async def update_mode(self, session_id: str, mode: str) -> bool:
+        """Set a session's mode; return True on success."""
+        raise NotImplementedError
+
+class FileSessionStore(SessionStore):
+    """Sessions stored in a JSON file on disk.
+
+    Reads are served from an mtime-keyed cache with an id -> session index;
+    writes are atomic (temp file + fsync + os.replace) and guarded by an
+    asyncio.Lock in-process plus an flock'd sidecar .lock file across
+    processes. All blocking syscalls run in worker threads so the event loop
+    keeps servicing other tool calls. Mutations land in the cache and are
+    flushed to disk by one coalesced write shortly after, so a burst of
+    back-to-back mode changes costs a single dump + fsync.
+    """
+
+    # How long a mutation may sit in the cache before it is flushed; long
+    # enough to coalesce a burst within one user turn, short enough that a
+    # crash loses almost nothing
+    FLUSH_DELAY = 0.01
+    # Failed flushes retry with exponential backoff (FLUSH_DELAY * 2^n) and
+    # stop after this many attempts, so a persistent error like a read-only
+    # mount doesn't spin retries for the life of the process
+    FLUSH_MAX_RETRIES = 8
+
+    def __init__(self, path: str):
+        self.path = path
+        # Serializes read-modify-write cycles so concurrent tool calls can't
+        # clobber each other's writes (asyncio.Lock, not threading.Lock --
+        # it is held across awaits without starving the loop)
+        self._lock = asyncio.Lock()
+        # Sidecar lock FD, opened once per process and never deleted
+        # (deleting the lock file would re-open the cross-process race)
+        self._lock_fd: Optional[int] = None
+        # Parsed document cached by file mtime, with the id index alongside
+        self._cache: Dict[str, Any] = {"mtime": 0, "data": None, "by_id": {}}
+        # Coalesced-write state: _dirty marks unflushed cache mutations
+        self._dirty = False
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_retries = 0
+
+    def _acquire_file_lock(self) -> None:
+        """Take the exclusive cross-process lock (blocking; run in a thread)."""
+        if self._lock_fd is None:
+            self._lock_fd = os.open(f"{self.path}.lock", os.O_CREAT | os.O_RDWR, 0o644)
+        fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+
+    def _release_file_lock(self) -> None:
+        """Release the cross-process lock."""
+        if self._lock_fd is not None:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _index_sessions(sessions_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the id -> session index for a sessions document."""
+        return {s.get("id"): s for s in sessions_data.get("sessions", [])}
+
+    def _by_id(self, sessions_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the id -> session index, cached when the document is cached."""
+        if sessions_data is self._cache["data"]:
+            return self._cache["by_id"]
+        return self._index_sessions(sessions_data)
+
+    async def load(self) -> Optional[Dict[str, Any]]:
+        """Read and parse the sessions file, served from cache when unchanged."""
+        try:
+            # Pending mutations make the cache newer than the file
+            if self._dirty:
+                return self._cache["data"]
+
+            st = await asyncio.to_thread(os.stat, self.path)
+            if st.st_mtime_ns == self._cache["mtime"] and self._cache["data"] is not None:
+                return self._cache["data"]
+
+            # One read syscall for the whole file instead of the buffered
+            # reader's chunked reads, offloaded so the loop keeps running
+            data = await asyncio.to_thread(_read_file_bytes, self.path)
+            parsed = orjson.loads(data)
+            self._cache["mtime"] = st.st_mtime_ns
+            self._cache["data"] = parsed
+            self._cache["by_id"] = self._index_sessions(parsed)
+            return parsed
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"❌ JARVIS: Error reading sessions file: {str(e)}")
+            return None
+
+    def _sync_save(self, sessions_data: Dict[str, Any]) -> int:
+        """Atomically write the document under the cross-process lock.
+
+        Blocking (flock, fsync, rename); run in a thread. Returns the new
+        file mtime in nanoseconds for the cache.
+        """
+        tmp_file = f"{self.path}.tmp.{os.getpid()}"
+        self._acquire_file_lock()
+        try:
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, orjson.dumps(sessions_data, option=orjson.OPT_INDENT_2))
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, self.path)
+            # Stat while still holding the lock: the moment it drops another
+            # process can replace the file, and pairing our document with
+            # their mtime would make the cache serve stale data forever
+            return os.stat(self.path).st_mtime_ns
+        finally:
+            self._release_file_lock()
+
+    def _mark_dirty(self, sessions_data: Dict[str, Any]) -> None:
+        """Adopt a mutated document into the cache and schedule a flush.
+
+        Call with self._lock held. Bursts of mutations within FLUSH_DELAY
+        collapse into the single already-scheduled write.
+        """
+        self._cache["data"] = sessions_data
+        self._cache["by_id"] = self._index_sessions(sessions_data)
+        self._dirty = True
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after(self.FLUSH_DELAY))
+
+    async def _flush_after(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        await self.flush_now()
+
+    async def flush_now(self) -> bool:
+        """Write any pending cache mutations to disk immediately."""
+        async with self._lock:
+            if not self._dirty:
+                return True
+            self._dirty = False
+            if await self.save(self._cache["data"]):
+                self._flush_retries = 0
+                return True
+            # Keep the mutation pending and schedule a fresh retry -- the
+            # current flush task is about to finish, so without this the
+            # failed write would sit unpersisted until the next mutation.
+            # Back off exponentially and give up after the cap; the dirty
+            # cache still flushes on the next mutation or at exit
+            self._dirty = True
+            self._flush_retries += 1
+            if self._flush_retries <= self.FLUSH_MAX_RETRIES:
+                delay = self.FLUSH_DELAY * (2 ** self._flush_retries)
+                self._flush_task = asyncio.create_task(self._flush_after(delay))
+            else:
+                print(f"❌ JARVIS: Giving up on sessions flush after {self.FLUSH_MAX_RETRIES} retries")
+            return False
+
+    def flush_on_exit(self) -> None:
+        """Synchronously flush pending mutations during shutdown.
+
+        For the teardown path after the event loop is gone: flush_now()
+        can't run there (its asyncio.Lock is bound to the dead loop), and
+        with no tasks left there is nothing to lock against.
+        """
+        if not self._dirty:
+            return
+        try:
+            self._sync_save(self._cache["data"])
+            self._dirty = False
+        except Exception as e:
+            print(f"❌ JARVIS: Error flushing sessions file at exit: {str(e)}")
+
+    async def save(self, sessions_data: Dict[str, Any]) -> bool:
+        """Atomically persist a full sessions document."""
+        try:
+            # One hop to a worker thread for the whole lock/write/fsync/rename
+            # sequence keeps the event loop free for other tool calls
+            mtime = await asyncio.to_thread(self._sync_save, sessions_data)
+            # Refresh the cache directly so the next read is a hit
+            self._cache["mtime"] = mtime
+            self._cache["data"] = sessions_data
+            self._cache["by_id"] = self._index_sessions(sessions_data)
+            return True
+        except Exception as e:
+            print(f"❌ JARVIS: Error writing sessions file: {str(e)}")
+            return False
+
+    async def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        sessions_data = await self.load()
+        if not sessions_data:
+            return None
+        return self._by_id(sessions_data).get(session_id)
+
+    async def get_active_session(self) -> Optional[Dict[str, Any]]:
+        sessions_data = await self.load()
+        if not sessions_data:
+            return None
+
+        # O(1) probe for the active session; scan only for the fallback
+        active_session = self._by_id(sessions_data).get(sessions_data.get("activeSessionId"))
+        if active_session and active_session.get("jarvisMode") == True:
+            return active_session
+
+        for session in sessions_data.get("sessions", []):
+            if session.get("jarvisMode") == True:
+                return session
+
+        return None
+
+    async def update_mode(self, session_id: str, mode: str) -> bool:
+        # Read-modify-write on the sessions file must be serialized
+        async with self._lock:
+            sessions_data = await self.load()
+            if not sessions_data:
+                return False
+
+            target_session = self._by_id(sessions_data).get(session_id)
+            if not target_session:
+                return False
+
+            target_session["mode"] = mode
+            self._mark_dirty(sessions_data)
+            return True
+
+class ApiSessionStore(SessionStore):
+    """Sessions stored behind the Holler SQLite API.
+
+    Uses one aiohttp.ClientSession per process so every call reuses the
+    connection pool to localhost instead of paying a fresh TCP handshake.
+    """
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        # Created lazily: the session must be born inside the running loop
+        self._http: Optional["aiohttp.ClientSession"] = None
+
+    def _session(self) -> "aiohttp.ClientSession":
+        """Return the shared aiohttp session, creating it on first use."""
+        if self._http is None or self._http.closed:
+            # Deferred import: aiohttp (plus multidict/yarl) only loads when
+            # the API backend makes its first call, not at server cold start
+            import aiohttp
+            self._http = aiohttp.ClientSession()
+        return self._http
+
+    async def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        async with self._session().get(f"{self.base_url}/sessions/{session_id}") as response:
+            if response.status != 200:
+                return None
+            return orjson.loads(await response.read())
+
+    async def get_active_session(self) -> Optional[Dict[str, Any]]:
+        async with self._session().get(f"{self.base_url}/sessions") as response:
+            if response.status != 200:
+                return None
+            sessions_data = orjson.loads(await response.read())
+
+        active_session_id = sessions_data.get("activeSessionId")
+
+        # Single pass: return the active Jarvis session if present, else
+        # fall back to the first Jarvis session seen
+        fallback = None
+        for session in sessions_data.get("sessions", []):
+            if session.get("jarvisMode") == True:
+                if session.get("id") == active_session_id:
+                    return session
+                if fallback is None:
+                    fallback = session
+
+        return fallback
+
+    async def update_mode(self, session_id: str, mode: str) -> bool:
+        async with self._session().put(f"{self.base_url}/sessions/{session_id}/mode",
+                                       json={"mode": mode}) as response:
+            return response.status == 200
+
+    def close_on_exit(self) -> None:
+        """Best-effort close of the shared HTTP session during shutdown.
+
+        For the teardown path after mcp.run()'s event loop is gone: a plain
+        await close() is impossible there, so a throwaway loop lets aiohttp
+        release its connector instead of warning about an unclosed session.
+        """
+        if self._http is None or self._http.closed:
+            return
+        try:
+            asyncio.run(self._http.close())
+        except Exception as e:
+            print(f"❌ JARVIS: Error closing HTTP session at exit: {str(e)}")
+
+# Selected once at import from JARVIS_STORE; every tool goes through this
+_store: SessionStore = FileSessionStore(SESSIONS_FILE) if JARVIS_STORE == "file" else ApiSessionStore(HOLLER_API_BASE)
+
 @mcp.tool()
 async def detect_magic_phrase(text: str) -> Dict[str, Any]:
     """Detect the exact phrase 'go to pound town claude code' and trigger execution.
-    
+
     When this exact phrase is detected, this tool will:
     1. Clear the current session context (/clear)
     2. Change session mode from planning to execution in SQLite
     3. Inject the execution prompt to start implementation
-    
+
     Args:
         text: Text to scan for the magic phrase
-        
+
     Returns:
         Dictionary with detection results and execution actions
     """
-    
+
+    # Cheap prefilter: one C-level substring scan rejects the common case
+    # (no phrase anywhere) before paying for full normalization. The needle
+    # is a single word so odd whitespace inside the phrase can't split it
+    if "pound" not in text.lower():
+        return {
+            "phrase_detected": False,
+            "magic_phrase": MAGIC_PHRASE,
+            "execution_triggered": False,
+            "message": "Magic phrase not detected. Continue planning."
+        }
+
     # Normalize text for detection (case insensitive, extra whitespace handling)
-    normalized_text = re.sub(r'\s+', ' ', text.lower().strip())
+    normalized_text = _normalize_text(text)
     normalized_phrase = MAGIC_PHRASE.lower()
-    
+
     # Check if magic phrase is present
     phrase_detected = normalized_phrase in normalized_text
-    
+
     if phrase_detected:
         print(f"🎯 JARVIS: MAGIC PHRASE DETECTED: '{MAGIC_PHRASE}'")
         print(f"🎯 JARVIS: In text: {text[:100]}...")
-        
+
         # Get active session for execution
         active_session = await get_active_jarvis_session()
-        
+
         if not active_session:
             return {
                 "phrase_detected": True,
@@ -62,10 +445,10 @@ async def detect_magic_phrase(text: str) -> Dict[str, Any]:
                 "execution_triggered": False,
                 "action_needed": "enable_jarvis_mode_first"
             }
-        
+
         # Execute the plan workflow
         execution_result = await execute_plan(active_session["id"])
-        
+
         if execution_result["success"]:
             return {
                 "phrase_detected": True,
@@ -86,7 +469,7 @@ async def detect_magic_phrase(text: str) -> Dict[str, Any]:
                 "error": execution_result.get("error", "Failed to execute plan"),
                 "session_id": active_session["id"]
             }
-    
+
     return {
         "phrase_detected": False,
         "magic_phrase": MAGIC_PHRASE,
@@ -97,78 +480,42 @@ async def detect_magic_phrase(text: str) -> Dict[str, Any]:
 @mcp.tool()
 async def execute_plan(session_id: str) -> Dict[str, Any]:
     """Execute the plan for a Jarvis session.
-    
-    Reads the plan from SQLite, updates mode to execution,
+
+    Reads the plan from the session store, updates mode to execution,
     and triggers context clearing + execution prompt.
-    
+
     Args:
         session_id: The session ID to execute the plan for
-        
+
     Returns:
         Dictionary with execution results and status
     """
-    
+
     try:
         print(f"🚀 JARVIS: Starting plan execution for session {session_id}")
-        
-        # Get session from SQLite API
-        session_response = requests.get(f"{HOLLER_API_BASE}/sessions/{session_id}")
-        if session_response.status_code != 200:
+
+        session = await _store.get_session(session_id)
+        if not session:
             return {"success": False, "error": f"Could not fetch session {session_id}"}
-        
-        session = session_response.json()
-        
+
         if not session.get("jarvisMode"):
             return {"success": False, "error": f"Session {session_id} is not in Jarvis mode"}
-        
+
         # Get the plan
         plan = session.get("plan", "")
         if not plan:
             return {"success": False, "error": "No plan found for execution"}
-        
-        print(f"📋 JARVIS: Plan to execute: {plan[:200]}...")
-        
-        # Update session mode to execution via API
-        update_response = requests.put(f"{HOLLER_API_BASE}/sessions/{session_id}/mode", 
-                                     json={"mode": "execution"})
-        
-        if update_response.status_code != 200:
-            return {"success": False, "error": "Failed to update session mode"}
-        
-        print(f"✅ JARVIS: Updated session {session_id} mode to 'execution'")
-        
-        # Build execution prompt with ultra-think instructions
-        execution_prompt = f"""🚀 **EXECUTION MODE: One-Shot Plan Implementation**
-
-**ULTRA-THINK APPROACH**: You have ONE chance to execute this plan perfectly. Think deeply about each step before acting.
-
-## Your Mission
-Execute the following plan completely and thoroughly:
-
-```
-{plan}
-```
 
-## Critical Instructions
-- **ONE SHOT EXECUTION**: This is your only opportunity - make it count
-- **ULTRA-THINK**: Before each action, consider:
-  - What exactly needs to be done?
-  - What are the potential edge cases?
-  - How can I verify this step worked?
-  - What could go wrong and how do I prevent it?
-- **BE THOROUGH**: Don't rush - think through each step carefully
-- **VERIFY YOUR WORK**: Test and validate each change you make
-- **COMPLETE THE MISSION**: Execute the entire plan, not just part of it
+        print(f"📋 JARVIS: Plan to execute: {plan[:200]}...")
 
-## Execution Context
-- Session ID: {session_id}
-- Mode: EXECUTION (one-shot)
-- Plan Source: Jarvis Planning Session
+        # Update session mode to execution
+        if not await _store.update_mode(session_id, "execution"):
+            return {"success": False, "error": "Failed to update session mode"}
 
----
+        print(f"✅ JARVIS: Updated session {session_id} mode to 'execution'")
 
-**BEGIN EXECUTION NOW - ULTRA-THINK AND IMPLEMENT THE PLAN**
-"""
+        # Build execution prompt with ultra-think instructions
+        execution_prompt = _EXECUTION_PROMPT_TPL.format(plan=plan, session_id=session_id)
 
         return {
             "success": True,
@@ -183,7 +530,7 @@ Execute the following plan completely and thoroughly:
                 "Monitor for completion to trigger planning mode again"
             ]
         }
-        
+
     except Exception as e:
         print(f"❌ JARVIS: Error in execute_plan: {str(e)}")
         return {"success": False, "error": str(e)}
@@ -191,34 +538,14 @@ Execute the following plan completely and thoroughly:
 @mcp.tool()
 async def get_active_jarvis_session() -> Optional[Dict[str, Any]]:
     """Get the currently active Jarvis session.
-    
+
     Returns:
         Dictionary with active session data or None if no active Jarvis session
     """
-    
+
     try:
-        # Get all sessions from SQLite API
-        sessions_response = requests.get(f"{HOLLER_API_BASE}/sessions")
-        if sessions_response.status_code != 200:
-            return None
-        
-        sessions_data = sessions_response.json()
-        sessions = sessions_data.get("sessions", [])
-        active_session_id = sessions_data.get("activeSessionId")
-        
-        # Find active session that has Jarvis mode enabled
-        for session in sessions:
-            if (session.get("id") == active_session_id and 
-                session.get("jarvisMode") == True):
-                return session
-        
-        # Fallback: find any Jarvis session
-        for session in sessions:
-            if session.get("jarvisMode") == True:
-                return session
-        
-        return None
-        
+        return await _store.get_active_session()
+
     except Exception as e:
         print(f"❌ JARVIS: Error getting active session: {str(e)}")
         return None
@@ -226,26 +553,22 @@ async def get_active_jarvis_session() -> Optional[Dict[str, Any]]:
 @mcp.tool()
 async def update_session_mode(session_id: str, mode: str) -> Dict[str, Any]:
     """Update the mode of a specific session.
-    
+
     Args:
         session_id: The session ID to update
         mode: New mode ("planning" or "execution")
-        
+
     Returns:
         Dictionary with update results
     """
-    
+
     try:
-        # Update session mode via API
-        response = requests.put(f"{HOLLER_API_BASE}/sessions/{session_id}/mode", 
-                              json={"mode": mode})
-        
-        if response.status_code == 200:
+        if await _store.update_mode(session_id, mode):
             print(f"✅ JARVIS: Updated session {session_id} mode to '{mode}'")
             return {"success": True, "session_id": session_id, "new_mode": mode}
         else:
-            return {"success": False, "error": f"API request failed with status {response.status_code}"}
-        
+            return {"success": False, "error": f"Failed to update session {session_id} mode"}
+
     except Exception as e:
         print(f"❌ JARVIS: Error updating session mode: {str(e)}")
         return {"success": False, "error": str(e)}
@@ -253,27 +576,27 @@ async def update_session_mode(session_id: str, mode: str) -> Dict[str, Any]:
 @mcp.tool()
 async def get_current_plan() -> Dict[str, Any]:
     """Get the current plan from the active Jarvis session.
-    
+
     Claude will automatically call this tool when it needs to see what
     plan is being worked on or when the user asks about the current plan.
-    
+
     Returns:
         Dictionary with current plan details
     """
-    
+
     try:
         active_session = await get_active_jarvis_session()
-        
+
         if not active_session:
             return {
                 "success": False,
                 "error": "No active Jarvis session found",
                 "suggestion": "Enable Jarvis Mode on a session first"
             }
-        
+
         plan = active_session.get("plan", "")
         mode = active_session.get("mode", "planning")
-        
+
         return {
             "success": True,
             "session_id": active_session["id"],
@@ -283,11 +606,19 @@ async def get_current_plan() -> Dict[str, Any]:
             "plan_length": len(plan) if plan else 0,
             "ready_for_execution": bool(plan and mode == "planning")
         }
-        
+
     except Exception as e:
         print(f"❌ JARVIS: Error getting current plan: {str(e)}")
         return {"success": False, "error": str(e)}
 
 if __name__ == "__main__":
     # Run the MCP server
-    mcp.run()
\ No newline at end of file
+    try:
+        mcp.run()
+    finally:
+        # An exit inside the coalescing window must not drop the last write,
+        # and the shared HTTP session must not leak its connector
+        if isinstance(_store, FileSessionStore):
+            _store.flush_on_exit()
+        elif isinstance(_store, ApiSessionStore):
+            _store.close_on_exit()
@@ -10,10 +10,7 @@ This MCP server provides tools that Claude AUTOMATICALLY calls when:
 """
 
 import asyncio
-import json
-import requests
 import re
-import subprocess
 from typing import Dict, Any, Optional
 from mcp.server.fastmcp import FastMCP
 
@@ -25,12 +22,34 @@ HOLLER_API_BASE = "http://localhost:3002/api"
 EXECUTION_PHRASES = [
     "go to pound town claude code",
     "go to pound town",
-    "execute the plan", 
+    "execute the plan",
     "run the plan",
     "start execution",
     "begin implementation"
 ]
 
+# Compiled once at import -- this runs on every user message
+_WS_RE = re.compile(r'\s+')
+
+# All execution phrases as one compiled alternation: a single pass over the
+# text instead of one substring scan per phrase (phrases are already lowercase)
+_PHRASE_RE = re.compile("|".join(re.escape(phrase) for phrase in EXECUTION_PHRASES))
+
+def _normalize_text(text: str) -> str:
+    """Lowercase and collapse whitespace runs to single spaces.
+
+    Fast path: most user messages are ASCII with no whitespace beyond
+    single spaces, so the regex substitution (and its string allocation)
+    is skipped for them. For ASCII input \\s is exactly
+    [ \\t\\n\\r\\f\\v\\x1c-\\x1f]; anything non-ASCII falls back to the regex
+    since \\s+ also collapses Unicode whitespace like \\xa0.
+    """
+    low = text.lower().strip()
+    if (not low.isascii() or "  " in low
+            or any(c in low for c in "\t\n\r\f\v\x1c\x1d\x1e\x1f")):
+        return _WS_RE.sub(' ', low)
+    return low
+
 @mcp.tool()
 async def analyze_user_input_for_execution_intent(user_message: str) -> Dict[str, Any]:
     """AUTOMATICALLY CALLED: Analyzes every user message to detect execution phrases.
@@ -48,32 +67,37 @@ async def analyze_user_input_for_execution_intent(user_message: str) -> Dict[str
     """
     
     # Normalize text for detection
-    normalized_text = re.sub(r'\s+', ' ', user_message.lower().strip())
+    normalized_text = _normalize_text(user_message)
     
-    # Check for execution phrases
-    detected_phrase = None
-    for phrase in EXECUTION_PHRASES:
-        if phrase.lower() in normalized_text:
-            detected_phrase = phrase
-            break
+    # Check for execution phrases in a single scan
+    phrase_match = _PHRASE_RE.search(normalized_text)
+    detected_phrase = phrase_match.group(0) if phrase_match else None
     
     if detected_phrase:
         print(f"🎯 JARVIS V2: EXECUTION PHRASE DETECTED: '{detected_phrase}'")
         print(f"🎯 JARVIS V2: In message: {user_message[:100]}...")
         
-        # Execute /execute-plan command directly
+        # Execute /execute-plan command directly (non-blocking: the event
+        # loop keeps serving other tool calls while node runs)
         try:
-            result = subprocess.run([
-                "node", 
-                "/Users/joshuamullet/code/holler/holler-next/scripts/execute-jarvis-plan.js"
-            ], capture_output=True, text=True, timeout=30)
-            
-            if result.returncode == 0:
+            proc = await asyncio.create_subprocess_exec(
+                "node",
+                "/Users/joshuamullet/code/holler/holler-next/scripts/execute-jarvis-plan.js",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=30)
+            except asyncio.TimeoutError:
+                proc.kill()
+                raise
+
+            if proc.returncode == 0:
                 return {
                     "execution_triggered": True,
                     "detected_phrase": detected_phrase,
                     "command_executed": "/execute-plan",
-                    "command_output": result.stdout,
+                    "command_output": stdout.decode(),
                     "status": "success",
                     "message": f"🚀 EXECUTION STARTED! Detected '{detected_phrase}' and ran /execute-plan successfully."
                 }
@@ -82,12 +106,12 @@ async def analyze_user_input_for_execution_intent(user_message: str) -> Dict[str
                     "execution_triggered": True,
                     "detected_phrase": detected_phrase,
                     "command_executed": "/execute-plan",
-                    "command_error": result.stderr,
+                    "command_error": stderr.decode(),
                     "status": "error",
-                    "message": f"❌ Detected '{detected_phrase}' but /execute-plan failed: {result.stderr}"
+                    "message": f"❌ Detected '{detected_phrase}' but /execute-plan failed: {stderr.decode()}"
                 }
-                
-        except subprocess.TimeoutExpired:
+
+        except asyncio.TimeoutError:
             return {
                 "execution_triggered": True,
                 "detected_phrase": detected_phrase,